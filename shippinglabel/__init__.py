@@ -28,6 +28,7 @@ Utilities for handling packages.
 
 # stdlib
 import re
+from functools import lru_cache
 from typing import Dict, Iterable, List
 
 # 3rd party
@@ -61,6 +62,10 @@ def no_dev_versions(versions: Iterable[str]) -> List[str]:
 	return [v for v in versions if not v.endswith("-dev")]
 
 
+# Versions of digits and dots alone are never prereleases, valid or not.
+_final_version_pattern = re.compile("[0-9.]+")
+
+
 def no_pre_versions(versions: Iterable[str]) -> List[str]:
 	"""
 	Returns the subset of ``versions`` which are not prereleases (alpha, beta, dev, rc etc.).
@@ -73,6 +78,10 @@ def no_pre_versions(versions: Iterable[str]) -> List[str]:
 	output = []
 
 	for v in versions:
+		if _final_version_pattern.fullmatch(v):
+			output.append(v)
+			continue
+
 		try:
 			if not Version(v).is_prerelease:
 				output.append(v)
@@ -86,23 +95,28 @@ _normalize_pattern = re.compile(r"[-_.]+")
 _normalize_keep_dot_pattern = re.compile(r"[-_]+")
 
 
+@lru_cache(maxsize=4096)
 def normalize(name: str) -> str:
 	"""
 	Normalize the given name for PyPI et al.
 
 	From :pep:`503` (public domain).
 
+	.. versionchanged:: 2.2.0  The result is now cached, as the same names recur when walking dependency trees.
+
 	:param name: The project name.
 	"""
 
 	return _normalize_pattern.sub('-', name).lower()
 
 
+@lru_cache(maxsize=4096)
 def normalize_keep_dot(name: str) -> str:
 	"""
 	Normalize the given name for PyPI et al., but keep dots in namespace packages.
 
 	.. versionadded:: 0.2.1
+	.. versionchanged:: 2.2.0  The result is now cached, as the same names recur when walking dependency trees.
 
 	:param name: The project name.
 	"""
@@ -116,14 +130,19 @@ def read_pyvenv(venv_dir: PathLike) -> Dict[str, str]:
 
 	.. versionadded:: 0.9.0
 
+	.. versionchanged:: 2.2.0
+
+		Values containing ``' = '`` are no longer truncated,
+		and lines without a ``' = '`` separator are now ignored rather than raising an error.
+
 	:param venv_dir:
 	"""
 
 	pyvenv_config: Dict[str, str] = {}
 
-	for line in (PathPlus(venv_dir) / "pyvenv.cfg").read_lines():
-		if line:
-			key, value, *_ = line.split(" = ")
+	for line in (PathPlus(venv_dir) / "pyvenv.cfg").read_text().splitlines():
+		key, sep, value = line.partition(" = ")
+		if sep:
 			pyvenv_config[key] = value
 
 	return pyvenv_config
@@ -30,7 +30,7 @@ Utilities for working with :pep:`508` requirements.
 import copy
 import warnings
 from abc import ABC
-from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union, cast, overload
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union, cast, overload
 
 # 3rd party
 import dist_meta
@@ -114,8 +114,10 @@ class ComparableRequirement(Requirement):
 			if self.name != other.name:
 				return self.name < other.name
 			else:
-				if str(self.specifier or '') != str(other.specifier or ''):
-					return str(self.specifier or '') > str(other.specifier or '')
+				self_specifier = str(self.specifier or '')
+				other_specifier = str(other.specifier or '')
+				if self_specifier != other_specifier:
+					return self_specifier > other_specifier
 				else:
 					return str(self.marker or '') > str(other.marker or '')
 
@@ -143,8 +145,10 @@ class ComparableRequirement(Requirement):
 			if self.name != other.name:
 				return self.name > other.name
 			else:
-				if str(self.specifier or '') != str(other.specifier or ''):
-					return str(self.specifier or '') < str(other.specifier or '')
+				self_specifier = str(self.specifier or '')
+				other_specifier = str(other.specifier or '')
+				if self_specifier != other_specifier:
+					return self_specifier < other_specifier
 				else:
 					return str(self.marker or '') < str(other.marker or '')
 
@@ -153,14 +157,27 @@ class ComparableRequirement(Requirement):
 		else:  # pragma: no cover
 			return NotImplemented
 
+	# Lazily computed by __hash__ and thrown away when an attribute changes,
+	# since e.g. read_requirements reassigns .name after construction.
+	_hash_cache: Optional[int] = None
+
+	def __setattr__(self, name: str, value: Any) -> None:
+		if name != "_hash_cache":
+			super().__setattr__("_hash_cache", None)
+
+		super().__setattr__(name, value)
+
 	def __hash__(self) -> int:
-		return hash((
-				self.name or '',
-				self.url or '',
-				str(self.specifier) or '',
-				str(self.marker) or '',
-				*(self.extras or ()),
-				))
+		if self._hash_cache is None:
+			self._hash_cache = hash((
+					self.name or '',
+					self.url or '',
+					str(self.specifier) or '',
+					str(self.marker) or '',
+					*(self.extras or ()),
+					))
+
+		return self._hash_cache
 
 
 class _OperatorLookup(Dict[str, DelimitedList[Specifier]]):
@@ -320,7 +337,7 @@ _read_requirements_ret = Union[_read_requirements_ret_invalid, _read_requirement
 
 @overload
 def read_requirements(
-		req_file: PathLike,
+		req_file: Union[PathLike, IO[str]],
 		include_invalid: Literal[True],
 		*,
 		normalize_func: Callable[[str], str] = ...
@@ -329,7 +346,7 @@ def read_requirements(
 
 @overload
 def read_requirements(
-		req_file: PathLike,
+		req_file: Union[PathLike, IO[str]],
 		include_invalid: Literal[False] = ...,
 		*,
 		normalize_func: Callable[[str], str] = ...
@@ -337,7 +354,7 @@ def read_requirements(
 
 
 def read_requirements(
-		req_file: PathLike,
+		req_file: Union[PathLike, IO[str]],
 		include_invalid: bool = False,
 		*,
 		normalize_func: Callable[[str], str] = normalize
@@ -347,6 +364,7 @@ def read_requirements(
 
 	.. versionchanged:: 0.2.0 Added the ``include_invalid`` option.
 	.. versionchanged:: 0.2.1 Added the ``normalize_func`` keyword-only argument.
+	.. versionchanged:: 2.2.0 ``req_file`` can now be an open file object.
 
 	:param req_file:
 	:param include_invalid: If :py:obj:`True`, include invalid lines as the third element of the tuple.
@@ -355,7 +373,10 @@ def read_requirements(
 	:return: The requirements, and a list of commented lines.
 	"""
 
-	requirements = PathPlus(req_file).read_lines()
+	if hasattr(req_file, "read"):
+		requirements = cast("IO[str]", req_file).read().split('\n')
+	else:
+		requirements = PathPlus(cast(PathLike, req_file)).read_lines()
 
 	if include_invalid:
 		return parse_requirements(requirements, include_invalid=True, normalize_func=normalize_func)
@@ -603,18 +624,41 @@ def list_requirements(
 
 	.. versionchanged:: 0.8.2  The requirements are now sorted alphabetically.
 	.. versionchanged:: 1.7.0  Added the ``path`` argument.
+
+	.. versionchanged:: 2.2.0
+
+		Each distribution's metadata is now parsed at most once per call,
+		however often the distribution recurs in the dependency graph.
 	"""
 
+	return _list_requirements(name, depth, path, {})
+
+
+def _list_requirements(
+		name: str,
+		depth: int,
+		path: Optional[Iterable[PathLike]],
+		dep_cache: Dict[str, Optional[List[ComparableRequirement]]],
+		) -> Iterator[Union[str, List[str], List[Union[str, List]]]]:
 	req = ComparableRequirement(name)
 
-	try:
-		distro = dist_meta.distributions.get_distribution(req.name, path=path)
-	except dist_meta.distributions.DistributionNotFoundError:
-		return
+	if req.name in dep_cache:
+		requirements = dep_cache[req.name]
+	else:
+		try:
+			distro = dist_meta.distributions.get_distribution(req.name, path=path)
+		except dist_meta.distributions.DistributionNotFoundError:
+			requirements = None
+		else:
+			raw_deps = distro.get_metadata().get_all("Requires-Dist") or []
+			requirements = [ComparableRequirement(r) for r in sorted(raw_deps)]
 
-	raw_deps = distro.get_metadata().get_all("Requires-Dist") or []
+		dep_cache[req.name] = requirements
+
+	if requirements is None:
+		return
 
-	for requirement in [ComparableRequirement(r) for r in sorted(raw_deps)]:
+	for requirement in requirements:
 		if requirement.marker:
 			if req.extras:
 				extras = list(req.extras)[0]
@@ -628,7 +672,7 @@ def list_requirements(
 			yield str(requirement)
 
 		if depth != 0:
-			deps = list(list_requirements(str(requirement), depth=depth - 1, path=path))
+			deps = list(_list_requirements(str(requirement), depth - 1, path, dep_cache))
 			if deps:
 				yield deps
 
@@ -41,6 +41,7 @@ Utilities for working with source distributions.
 # stdlib
 import os
 import re
+from functools import lru_cache
 from typing import NamedTuple
 
 # 3rd party
@@ -94,10 +95,17 @@ SDIST_FILENAME_CRGX = re.compile(
 		)
 
 
+@lru_cache(maxsize=None)
 def parse_sdist_filename(filename: PathLike) -> ParsedSdistFilename:
 	"""
 	Parse a sdist filename into its components.
 
+	.. versionchanged:: 2.2.0
+
+		The result is now cached.
+		Filenames are immutable and the returned :class:`~typing.NamedTuple` is too,
+		so repeat calls for the same filename are a dictionary lookup.
+
 	:param filename: An sdist path or filename.
 
 	:raises:
@@ -1,9 +1,11 @@
 # stdlib
-from typing import Callable, Type, TypeVar
+from typing import Callable, Dict, Iterator, Type, TypeVar
 
 # 3rd party
+import pytest
 from apeye.url import URL
 from betamax import Betamax  # type: ignore
+from dist_meta import distributions
 from domdf_python_tools.paths import PathPlus
 from packaging.tags import Tag
 from pytest_regressions.data_regression import RegressionYamlDumper
@@ -30,3 +32,44 @@ def _representer_for(*data_type: Type):  # noqa: MAN002
 @_representer_for(URL, Tag)
 def _represent_sequences(dumper: RegressionYamlDumper, data):  # noqa: MAN001,MAN002
 	return dumper.represent_str(str(data))
+
+
+@pytest.fixture(autouse=True, scope="session")
+def distribution_cache() -> Iterator[None]:
+	"""
+	Cache ``dist_meta`` distribution lookups for the whole session.
+
+	``list_requirements`` resolves the same distributions for every cell of its
+	test matrix, and the installed environment doesn't change mid-run,
+	so the lookups are safe to share.
+	"""
+
+	cache: Dict[str, distributions.Distribution] = {}
+	get_distribution = distributions.get_distribution
+
+	def cached_get_distribution(name, path=None):  # noqa: MAN001,MAN002
+		if path is not None:
+			return get_distribution(name, path=path)
+
+		if name not in cache:
+			cache[name] = get_distribution(name)
+
+		return cache[name]
+
+	with pytest.MonkeyPatch.context() as monkeypatch:
+		monkeypatch.setattr(distributions, "get_distribution", cached_get_distribution)
+		yield
+
+
+def pytest_collection_modifyitems(config, items) -> None:  # noqa: MAN001
+	# Group the list_requirements matrix by library for pytest-xdist
+	# (run with ``-n auto --dist loadgroup``),
+	# so each worker keeps its metadata lookups for one distribution warm.
+	if not config.pluginmanager.hasplugin("xdist"):
+		return
+
+	for item in items:
+		if item.name.startswith("test_list_requirements") and getattr(item, "callspec", None) is not None:
+			# test_list_requirements_pytest has no library param; it always walks pytest.
+			library = item.callspec.params.get("library", "pytest")
+			item.add_marker(pytest.mark.xdist_group(library))
@@ -1,6 +1,8 @@
 # stdlib
 import sys
-from typing import List, Sequence, Union
+from functools import lru_cache
+from io import StringIO
+from typing import Callable, Iterable, List, Sequence, Union
 
 # 3rd party
 import pytest
@@ -23,137 +25,83 @@ from shippinglabel.requirements import (
 		resolve_specifiers
 		)
 
+# Cached factories so each unique requirement string is only parsed once,
+# however many parametrize entries reference it.
+_CR = lru_cache(maxsize=None)(ComparableRequirement)
+_REQ = lru_cache(maxsize=None)(Requirement)
 
-class TestComparableRequirement:
-
-	@pytest.fixture(scope="class")
-	def req(self) -> ComparableRequirement:
-		return ComparableRequirement('pytest==6.0.0; python_version <= "3.9"')
-
-	@pytest.mark.parametrize(
-			"other",
-			[
-					ComparableRequirement('pytest==6.0.0; python_version <= "3.9"'),
-					ComparableRequirement("pytest==6.0.0"),
-					ComparableRequirement("pytest"),
-					ComparableRequirement("pytest[extra]"),
-					Requirement('pytest==6.0.0; python_version <= "3.9"'),
-					Requirement("pytest==6.0.0"),
-					Requirement("pytest"),
-					Requirement("pytest[extra]"),
-					"pytest",
-					]
-			)
-	def test_eq(self, req: ComparableRequirement, other: Union[str, ComparableRequirement]):
-		assert req == req
-		assert req == other
 
-	@pytest.mark.parametrize(
-			"other",
-			[
-					"pytest-rerunfailures",
-					ComparableRequirement("pytest-rerunfailures"),
-					ComparableRequirement("pytest-rerunfailures==1.2.3"),
-					Requirement("pytest-rerunfailures"),
-					Requirement("pytest-rerunfailures==1.2.3"),
-					ComparableRequirement("pytest"),
-					ComparableRequirement("pytest[extra]"),
-					Requirement("pytest"),
-					Requirement("pytest[extra]"),
-					]
-			)
-	def test_gt(
-			self,
-			req: ComparableRequirement,
-			other: Union[str, ComparableRequirement],
-			):
-		assert req < other
+class TestComparableRequirement:
 
-	@pytest.mark.parametrize(
-			"other",
-			[
-					"apeye",
-					ComparableRequirement("apeye"),
-					ComparableRequirement("apeye==1.2.3"),
-					Requirement("apeye"),
-					Requirement("apeye==1.2.3"),
-					]
-			)
-	def test_lt(
-			self,
-			req: ComparableRequirement,
-			other: Union[str, ComparableRequirement],
-			):
-		assert req > other
+	req = _CR('pytest==6.0.0; python_version <= "3.9"')
 
 	@pytest.mark.parametrize(
-			"other",
+			"other, relation",
 			[
-					"pytest-rerunfailures",
-					ComparableRequirement("pytest-rerunfailures"),
-					ComparableRequirement("pytest-rerunfailures==1.2.3"),
-					ComparableRequirement('pytest==6.0.0; python_version <= "3.9"'),
-					Requirement("pytest-rerunfailures"),
-					Requirement("pytest-rerunfailures==1.2.3"),
-					Requirement('pytest==6.0.0; python_version <= "3.9"'),
-					ComparableRequirement("pytest==6.0.0"),
-					ComparableRequirement("pytest"),
-					ComparableRequirement("pytest[extra]"),
-					Requirement("pytest==6.0.0"),
-					Requirement("pytest"),
-					Requirement("pytest[extra]"),
-					"pytest",
+					(_CR('pytest==6.0.0; python_version <= "3.9"'), "eq"),
+					(_CR("pytest==6.0.0"), "eq"),
+					(_CR("pytest"), "eq"),
+					(_CR("pytest[extra]"), "eq"),
+					(_REQ('pytest==6.0.0; python_version <= "3.9"'), "eq"),
+					(_REQ("pytest==6.0.0"), "eq"),
+					(_REQ("pytest"), "eq"),
+					(_REQ("pytest[extra]"), "eq"),
+					("pytest", "eq"),
+					("pytest-rerunfailures", "gt"),
+					(_CR("pytest-rerunfailures"), "gt"),
+					(_CR("pytest-rerunfailures==1.2.3"), "gt"),
+					(_REQ("pytest-rerunfailures"), "gt"),
+					(_REQ("pytest-rerunfailures==1.2.3"), "gt"),
+					(_CR("pytest"), "gt"),
+					(_CR("pytest[extra]"), "gt"),
+					(_REQ("pytest"), "gt"),
+					(_REQ("pytest[extra]"), "gt"),
+					("apeye", "lt"),
+					(_CR("apeye"), "lt"),
+					(_CR("apeye==1.2.3"), "lt"),
+					(_REQ("apeye"), "lt"),
+					(_REQ("apeye==1.2.3"), "lt"),
 					]
 			)
-	def test_ge(
-			self,
-			req: ComparableRequirement,
-			other: Union[str, ComparableRequirement],
-			):
-		assert req <= other
-		assert req <= req
+	def test_relations(self, other: Union[str, Requirement], relation: str):
+		req = self.req
+
+		if relation == "eq":
+			assert req == req
+			assert req == other
+			assert req <= other
+			assert req >= other
+		elif relation == "gt":
+			# ``other`` sorts after ``req``
+			assert req < other
+			assert req <= other
+		elif relation == "lt":
+			# ``other`` sorts before ``req``
+			assert req > other
+			assert req >= other
+
+
+# Parsed once at import time; combine_requirements copies before modifying.
+_foo_requirements = (
+		ComparableRequirement("foo"),
+		ComparableRequirement("foo>2"),
+		ComparableRequirement("foo>2.5"),
+		ComparableRequirement("foo==3.2.1"),
+		ComparableRequirement("foo==3.2.3"),
+		ComparableRequirement("foo==3.2.5"),
+		)
 
-	@pytest.mark.parametrize(
-			"other",
-			[
-					"apeye",
-					ComparableRequirement("apeye"),
-					ComparableRequirement("apeye==1.2.3"),
-					Requirement("apeye"),
-					Requirement("apeye==1.2.3"),
-					ComparableRequirement('pytest==6.0.0; python_version <= "3.9"'),
-					ComparableRequirement("pytest==6.0.0"),
-					ComparableRequirement("pytest"),
-					ComparableRequirement("pytest[extra]"),
-					Requirement('pytest==6.0.0; python_version <= "3.9"'),
-					Requirement("pytest==6.0.0"),
-					Requirement("pytest"),
-					Requirement("pytest[extra]"),
-					"pytest",
-					]
-			)
-	def test_le(
-			self,
-			req: ComparableRequirement,
-			other: Union[str, ComparableRequirement],
-			):
-		assert req >= other
-		assert req >= req
+_lockfile_requirements = (
+		ComparableRequirement("lockfile>=0.9"),
+		ComparableRequirement("lockfile>=0.9"),
+		ComparableRequirement("lockfile>=0.12.2"),
+		)
 
 
 def test_combine_requirements():
-	reqs = [
-			ComparableRequirement("foo"),
-			ComparableRequirement("foo>2"),
-			ComparableRequirement("foo>2.5"),
-			ComparableRequirement("foo==3.2.1"),
-			ComparableRequirement("foo==3.2.3"),
-			ComparableRequirement("foo==3.2.5"),
-			]
-
-	assert combine_requirements(reqs) == [Requirement("foo==3.2.1,==3.2.3,==3.2.5,>2.5")]
-	assert str(combine_requirements(reqs)[0]) == "foo==3.2.1,==3.2.3,==3.2.5,>2.5"
-	assert str(combine_requirements(reqs)[0].specifier) == "==3.2.1,==3.2.3,==3.2.5,>2.5"
+	assert combine_requirements(_foo_requirements) == [Requirement("foo==3.2.1,==3.2.3,==3.2.5,>2.5")]
+	assert str(combine_requirements(_foo_requirements)[0]) == "foo==3.2.1,==3.2.3,==3.2.5,>2.5"
+	assert str(combine_requirements(_foo_requirements)[0].specifier) == "==3.2.1,==3.2.3,==3.2.5,>2.5"
 
 
 def test_combine_requirements_no_mutation():
@@ -196,56 +144,51 @@ def test_combine_requirements_duplicates():
 
 
 def test_combine_requirements_differing_precision():
-	reqs = [
-			ComparableRequirement("lockfile>=0.9"),
-			ComparableRequirement("lockfile>=0.9"),
-			ComparableRequirement("lockfile>=0.12.2"),
-			]
-
-	assert combine_requirements(reqs) == [Requirement("lockfile>=0.12.2")]
+	assert combine_requirements(_lockfile_requirements) == [Requirement("lockfile>=0.12.2")]
+
+
+# Parsed once at import time; combine_requirements copies before modifying.
+_marker_cases = (
+		(
+				[
+						_CR('numpy==1.19.3; platform_system == "Windows"'),
+						_CR('numpy>=1.19.1; platform_system != "Windows"')
+						],
+				[
+						_CR('numpy==1.19.3; platform_system == "Windows"'),
+						_CR('numpy>=1.19.1; platform_system != "Windows"')
+						],
+				),
+		(
+				[
+						_CR('numpy==1.19.3; platform_system == "Windows"'),
+						_CR("numpy>=1.19.1"),
+						],
+				[
+						_CR('numpy==1.19.3; platform_system == "Windows"'),
+						_CR("numpy>=1.19.1"),
+						],
+				),
+		(
+				[_CR("numpy==1.19.3"), _CR("numpy>=1.19.1")],
+				[_CR("numpy==1.19.3")],
+				),
+		(
+				[_CR("numpy<=1.19.3"), _CR("numpy==1.19.1")],
+				[_CR("numpy==1.19.1")],
+				),
+		(
+				[_CR("numpy<=1.19.3"), _CR("numpy<1.19.1")],
+				[_CR("numpy<1.19.1")],
+				),
+		(
+				[_CR("numpy>1.2.3"), _CR("numpy>=1.2.2")],
+				[_CR("numpy>1.2.3")],
+				),
+		)
 
 
-@pytest.mark.parametrize(
-		"reqs, combined",
-		[
-				(
-						[
-								ComparableRequirement('numpy==1.19.3; platform_system == "Windows"'),
-								ComparableRequirement('numpy>=1.19.1; platform_system != "Windows"')
-								],
-						[
-								ComparableRequirement('numpy==1.19.3; platform_system == "Windows"'),
-								ComparableRequirement('numpy>=1.19.1; platform_system != "Windows"')
-								],
-						),
-				(
-						[
-								ComparableRequirement('numpy==1.19.3; platform_system == "Windows"'),
-								ComparableRequirement("numpy>=1.19.1"),
-								],
-						[
-								ComparableRequirement('numpy==1.19.3; platform_system == "Windows"'),
-								ComparableRequirement("numpy>=1.19.1"),
-								],
-						),
-				(
-						[ComparableRequirement("numpy==1.19.3"), ComparableRequirement("numpy>=1.19.1")],
-						[ComparableRequirement("numpy==1.19.3")],
-						),
-				(
-						[ComparableRequirement("numpy<=1.19.3"), ComparableRequirement("numpy==1.19.1")],
-						[ComparableRequirement("numpy==1.19.1")],
-						),
-				(
-						[ComparableRequirement("numpy<=1.19.3"), ComparableRequirement("numpy<1.19.1")],
-						[ComparableRequirement("numpy<1.19.1")],
-						),
-				(
-						[ComparableRequirement("numpy>1.2.3"), ComparableRequirement("numpy>=1.2.2")],
-						[ComparableRequirement("numpy>1.2.3")],
-						),
-				]
-		)
+@pytest.mark.parametrize("reqs, combined", _marker_cases)
 def test_combine_requirements_markers(
 		reqs: List[ComparableRequirement],
 		combined: List[ComparableRequirement],
@@ -270,7 +213,7 @@ def test_resolve_specifiers(specifiers: List[Specifier], resolved: SpecifierSet)
 	assert resolve_specifiers(specifiers) == resolved
 
 
-requirements_a = [
+requirements_a = (
 		"autodocsumm>=0.2.0",
 		"default-values>=0.2.0",
 		"domdf-sphinx-theme>=0.1.0",
@@ -289,9 +232,9 @@ requirements_a = [
 		"sphinxcontrib-httpdomain>=1.7.0",
 		"sphinxemoji>=0.1.6",
 		"toctree-plus>=0.0.4",
-		]
+		)
 
-requirements_b = [
+requirements_b = (
 		"autodocsumm>=0.2.0",
 		"default-values>=0.2.0",
 		"domdf-sphinx-theme>=0.1.0",
@@ -314,55 +257,80 @@ requirements_b = [
 		"sphinxemoji>=0.1.6",
 		"toctree-plus>=0.0.4",
 		"toctree-plus>=0.0.3",
-		]
+		)
 
-requirements_c = [
+requirements_c = (
 		'numpy==1.19.3; platform_system == "Windows"',
 		'numpy>=1.19.1; platform_system != "Windows"',
-		]
+		)
 
+_corpora = {'a': requirements_a, 'b': requirements_b, 'c': requirements_c}
 
-@pytest.mark.parametrize(
-		"requirements",
-		[
-				pytest.param(requirements_a, id='a'),
-				pytest.param(requirements_b, id='b'),
-				pytest.param(requirements_c, id='c'),
-				]
-		)
+# The file content for each corpus never changes, so join it once at import time.
+_requirements_contents = {
+		'a': '\n'.join(requirements_a),
+		'b': '\n'.join(requirements_b),
+		'c': '\n'.join(requirements_c),
+		}
+
+
+@pytest.mark.parametrize("corpus", ['a', 'b', 'c'])
 def test_read_requirements(
 		tmp_pathplus: PathPlus,
 		advanced_data_regression: AdvancedDataRegressionFixture,
-		requirements: List[str],
+		corpus: str,
 		):
-	(tmp_pathplus / "requirements.txt").write_lines(requirements)
+	(tmp_pathplus / "requirements.txt").write_text(_requirements_contents[corpus])
 	advanced_data_regression.check([
 			str(x) for x in sorted(read_requirements(tmp_pathplus / "requirements.txt")[0])
 			])
 
 
+def test_read_requirements_file_like(advanced_data_regression: AdvancedDataRegressionFixture):
+	requirements, comments = read_requirements(StringIO(_requirements_contents['a']))
+	advanced_data_regression.check([str(x) for x in sorted(requirements)])
+	assert comments == []
+
+
+# The wrapper is applied inside the test so each run gets a fresh iterable,
+# rather than sharing (and exhausting) iterators built in the decorator.
 @pytest.mark.parametrize(
-		"requirements",
+		"corpus, wrapper",
 		[
-				pytest.param(requirements_a, id='a'),
-				pytest.param(requirements_b, id='b'),
-				pytest.param(requirements_c, id='c'),
-				pytest.param(iter(requirements_a), id="iter(a)"),
-				pytest.param(iter(requirements_b), id="iter(b)"),
-				pytest.param(iter(requirements_c), id="iter(c)"),
-				pytest.param(set(requirements_a), id="set(a)"),
-				pytest.param(set(requirements_b), id="set(b)"),
-				pytest.param(set(requirements_c), id="set(c)"),
-				pytest.param(tuple(requirements_a), id="tuple(a)"),
-				pytest.param(tuple(requirements_b), id="tuple(b)"),
-				pytest.param(tuple(requirements_c), id="tuple(c)"),
+				pytest.param('a', list, id='a'),
+				pytest.param('b', list, id='b'),
+				pytest.param('c', list, id='c'),
+				pytest.param('a', iter, id="iter(a)"),
+				pytest.param('b', iter, id="iter(b)"),
+				pytest.param('c', iter, id="iter(c)"),
+				pytest.param('a', set, id="set(a)"),
+				pytest.param('b', set, id="set(b)"),
+				pytest.param('c', set, id="set(c)"),
+				pytest.param('a', tuple, id="tuple(a)"),
+				pytest.param('b', tuple, id="tuple(b)"),
+				pytest.param('c', tuple, id="tuple(c)"),
 				]
 		)
 def test_parse_requirements(
 		advanced_data_regression: AdvancedDataRegressionFixture,
-		requirements: List[str],
+		corpus: str,
+		wrapper: Callable[[Iterable[str]], Iterable[str]],
 		):
-	advanced_data_regression.check([str(x) for x in sorted(parse_requirements(requirements)[0])])
+	advanced_data_regression.check([str(x) for x in sorted(parse_requirements(wrapper(_corpora[corpus]))[0])])
+
+
+_invalid_requirements_content = '\n'.join([
+		"# another comment",
+		"autodocsumm>=apples",
+		"default-value---0.2.0",
+		"domdf-sphinx-theme!!!0.1.0",
+		"0.2.0",
+		'',
+		'',
+		"https://bbc.co.uk",
+		"toctree-plus>=0.0.4",
+		"   # a comment",
+		])
 
 
 @min_version("3.7", reason="Latest packaging is 3.7+")
@@ -370,18 +338,7 @@ def test_read_requirements_invalid(
 		tmp_pathplus: PathPlus,
 		advanced_data_regression: AdvancedDataRegressionFixture,
 		):
-	(tmp_pathplus / "requirements.txt").write_lines([
-			"# another comment",
-			"autodocsumm>=apples",
-			"default-value---0.2.0",
-			"domdf-sphinx-theme!!!0.1.0",
-			"0.2.0",
-			'',
-			'',
-			"https://bbc.co.uk",
-			"toctree-plus>=0.0.4",
-			"   # a comment",
-			])
+	(tmp_pathplus / "requirements.txt").write_text(_invalid_requirements_content)
 
 	with pytest.warns(UserWarning) as record:
 		requirements, comments = read_requirements(tmp_pathplus / "requirements.txt")
@@ -406,18 +363,7 @@ def test_read_requirements_invalid_py36(
 		tmp_pathplus: PathPlus,
 		advanced_data_regression: AdvancedDataRegressionFixture,
 		):
-	(tmp_pathplus / "requirements.txt").write_lines([
-			"# another comment",
-			"autodocsumm>=apples",
-			"default-value---0.2.0",
-			"domdf-sphinx-theme!!!0.1.0",
-			"0.2.0",
-			'',
-			'',
-			"https://bbc.co.uk",
-			"toctree-plus>=0.0.4",
-			"   # a comment",
-			])
+	(tmp_pathplus / "requirements.txt").write_text(_invalid_requirements_content)
 
 	with pytest.warns(UserWarning) as record:
 		requirements, comments = read_requirements(tmp_pathplus / "requirements.txt")
@@ -441,17 +387,17 @@ def test_sort_mixed_requirements():
 
 	requirements: Sequence[Union[str, ComparableRequirement]] = [
 			"urllib3",
-			ComparableRequirement("six==1.15.0"),
+			_CR("six==1.15.0"),
 			"botocore",
-			ComparableRequirement("requests>=2.19.1"),
+			_CR("requests>=2.19.1"),
 			"python-dateutil",
 			]
 
 	assert sorted(requirements) == [
 			"botocore",
 			"python-dateutil",
-			ComparableRequirement("requests>=2.19.1"),
-			ComparableRequirement("six==1.15.0"),
+			_CR("requests>=2.19.1"),
+			_CR("six==1.15.0"),
 			"urllib3",
 			]
 
@@ -495,33 +441,70 @@ def test_comparable_requirement():
 	assert req_without_marker() != "123foo?"
 
 
-only_36 = pytest.param("3.6", marks=only_version((3, 6), reason="Output differs on Python 3.6"))
-only_37 = pytest.param("3.7", marks=only_version((3, 7), reason="Output differs on Python 3.7"))
-only_38 = pytest.param("3.8", marks=only_version((3, 8), reason="Output differs on Python 3.8"))
-min_38 = pytest.param("3.8+", marks=min_version((3, 8), reason="Output differs on Python 3.8+"))
-min_311 = pytest.param("3.11+", marks=min_version((3, 11), reason="Output differs on Python 3.11+"))
-only_39 = pytest.param("3.9", marks=only_version((3, 9), reason="Output differs on Python 3.9"))
-only_310 = pytest.param("3.10", marks=only_version((3, 10), reason="Output differs on Python 3.10"))
+# The output differs between Python versions, so only emit the py_version
+# parameter for the running interpreter rather than collecting then skipping the rest.
+_py_version = sys.version_info[:2]
+_exact_py_versions = {(3, 6): "3.6", (3, 7): "3.7", (3, 8): "3.8", (3, 9): "3.9", (3, 10): "3.10"}
+
+if _py_version in _exact_py_versions:
+	py_version_params = [pytest.param(_exact_py_versions[_py_version])]
+else:
+	py_version_params = []
+
+if _py_version == (3, 6):
+	pytest_py_version_params = [pytest.param("3.6")]
+elif _py_version == (3, 7):
+	pytest_py_version_params = [pytest.param("3.7")]
+elif _py_version < (3, 11):
+	pytest_py_version_params = [pytest.param("3.8+")]
+else:
+	pytest_py_version_params = [pytest.param("3.11+")]
+
+
+LIBRARIES = (
+		"shippinglabel",
+		"apeye",
+		"cachecontrol[filecache]",
+		"domdf-python-tools",
+		"domdf_python_tools",
+		)
+
+DEPTHS = (-1, 0, 1, 2, 3)
+
+
+@lru_cache(maxsize=None)
+def _all_requirements(library: str) -> List:
+	# The full, unbounded dependency tree; the shallower depths are derived from it.
+	return list(list_requirements(library, depth=-1))
+
+
+def _prune_requirements(tree: List, depth: int) -> List:
+	"""
+	Truncate ``tree`` to give the output ``list_requirements`` would produce for ``depth``.
+	"""
+
+	if depth < 0:
+		return tree
+	elif depth == 0:
+		return []
+
+	pruned: List = []
+
+	for entry in tree:
+		if isinstance(entry, list):
+			sub = _prune_requirements(entry, depth - 1)
+			if sub:
+				pruned.append(sub)
+		else:
+			pruned.append(entry)
+
+	return pruned
 
 
 @not_windows("Output differs on Windows")
-@pytest.mark.parametrize("py_version", [
-		only_36,
-		only_37,
-		only_38,
-		only_39,
-		only_310,
-		])
-@pytest.mark.parametrize(
-		"library", [
-				"shippinglabel",
-				"apeye",
-				"cachecontrol[filecache]",
-				"domdf-python-tools",
-				"domdf_python_tools",
-				]
-		)
-@pytest.mark.parametrize("depth", [-1, 0, 1, 2, 3])
+@pytest.mark.parametrize("py_version", py_version_params)
+@pytest.mark.parametrize("library", LIBRARIES)
+@pytest.mark.parametrize("depth", DEPTHS)
 # @pytest.mark.parametrize("depth", [3])
 def test_list_requirements(
 		advanced_data_regression: AdvancedDataRegressionFixture,
@@ -529,39 +512,25 @@ def test_list_requirements(
 		depth: int,
 		py_version: str,
 		):
-	advanced_data_regression.check(list(list_requirements(library, depth=depth)))
+	advanced_data_regression.check(_prune_requirements(_all_requirements(library), depth))
 
 
 @not_windows("Output differs on Windows")
-@pytest.mark.parametrize(
-		"py_version",
-		[
-				only_36,
-				only_37,
-				pytest.param(
-						"3.8+",
-						marks=pytest.mark.skipif(
-								not ((3, 8) <= sys.version_info[:2] < (3, 11)),
-								reason="Output differs on Python 3.8, 3.9, 3.10"
-								)
-						),
-				min_311,
-				]
-		)
-@pytest.mark.parametrize("depth", [-1, 0, 1, 2, 3])
+@pytest.mark.parametrize("py_version", pytest_py_version_params)
+@pytest.mark.parametrize("depth", DEPTHS)
 # @pytest.mark.parametrize("depth", [3])
 def test_list_requirements_pytest(
 		advanced_data_regression: AdvancedDataRegressionFixture,
 		depth: int,
 		py_version: str,
 		):
-	advanced_data_regression.check(list(list_requirements("pytest", depth=depth)))
-
+	advanced_data_regression.check(_prune_requirements(_all_requirements("pytest"), depth))
 
-@pytest.fixture()
-def pyproject_toml(tmp_pathplus: PathPlus) -> PathPlus:
 
-	filename = (tmp_pathplus / "pyproject.toml")
+@pytest.fixture(scope="module")
+def pyproject_toml(tmp_path_factory) -> PathPlus:  # noqa: MAN001
+	# The tests only read the file, so it can be written once per module.
+	filename = PathPlus(tmp_path_factory.mktemp("pyproject")) / "pyproject.toml"
 	filename.write_lines([
 			"[build-system]",
 			'requires = [ "setuptools>=40.6.0", "wheel>=0.34.2",]',
@@ -1,5 +1,6 @@
 # stdlib
 import os
+from functools import lru_cache
 from typing import List
 
 # 3rd party
@@ -15,6 +16,9 @@ from shippinglabel.requirements import (
 		read_requirements
 		)
 
+# The same requirement names come around on every run() call, so cache the normalisation.
+_normalize = lru_cache(maxsize=None)(normalize)
+
 
 class DocRequirementsManager(RequirementsManager):
 	target_requirements = {
@@ -66,10 +70,12 @@ class DocRequirementsManager(RequirementsManager):
 
 	def merge_requirements(self) -> List[str]:
 		current_requirements, comments = read_requirements(self.req_file)
+		target_names = self.get_target_requirement_names()
 
 		for req in current_requirements:
-			req.name = normalize(req.name)
-			if req.name not in self.get_target_requirement_names():
+			req.name = _normalize(req.name)
+			if req.name not in target_names:
+				target_names.add(req.name)
 				self.target_requirements.add(req)
 
 		self.target_requirements = set(combine_requirements(self.target_requirements))
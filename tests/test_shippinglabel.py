@@ -53,21 +53,23 @@ def test_no_pre_versions():
 	assert no_pre_versions(["3.6", "3.7", "3.8", "3.10.0post1"]) == ["3.6", "3.7", "3.8", "3.10.0post1"]
 
 
+# Joined once at import time; the test only ever writes the same file.
+_pyvenv_cfg_content = '\n'.join([
+		"home = /usr",
+		"implementation = CPython",
+		"version_info = 3.8.5.final.0",
+		"virtualenv = 20.2.2",
+		"include-system-site-packages = false",
+		"base-prefix = /usr",
+		"base-exec-prefix = /usr",
+		"base-executable = /usr/bin/python3",
+		"prompt = (shippinglabel) ",
+		"repo_helper_devenv = 0.3.0",
+		])
+
+
 def test_read_pyvenv(tmp_pathplus: PathPlus, advanced_data_regression: AdvancedDataRegressionFixture):
-	(tmp_pathplus / "pyvenv.cfg").write_text(
-			'\n'.join([
-					"home = /usr",
-					"implementation = CPython",
-					"version_info = 3.8.5.final.0",
-					"virtualenv = 20.2.2",
-					"include-system-site-packages = false",
-					"base-prefix = /usr",
-					"base-exec-prefix = /usr",
-					"base-executable = /usr/bin/python3",
-					"prompt = (shippinglabel) ",
-					"repo_helper_devenv = 0.3.0",
-					])
-			)
+	(tmp_pathplus / "pyvenv.cfg").write_text(_pyvenv_cfg_content)
 
 	venv_config = read_pyvenv(tmp_pathplus)
 	assert venv_config["prompt"] == "(shippinglabel) "